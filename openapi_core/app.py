@@ -2,7 +2,9 @@
 
 from functools import cached_property
 from pathlib import Path
+from typing import Dict
 from typing import Optional
+from typing import cast
 
 from jsonschema._utils import Unset
 from jsonschema.validators import _UNSET
@@ -20,6 +22,7 @@ from openapi_core.exceptions import SpecError
 from openapi_core.protocols import Request
 from openapi_core.protocols import Response
 from openapi_core.protocols import WebhookRequest
+from openapi_core.protocols import supports
 from openapi_core.types import AnyRequest
 from openapi_core.unmarshalling.request import (
     UNMARSHALLERS as REQUEST_UNMARSHALLERS,
@@ -53,6 +56,7 @@ from openapi_core.unmarshalling.response.types import ResponseUnmarshallerType
 from openapi_core.unmarshalling.response.types import (
     WebhookResponseUnmarshallerType,
 )
+from openapi_core.util import cached_by_identity
 from openapi_core.validation.request import VALIDATORS as REQUEST_VALIDATORS
 from openapi_core.validation.request import (
     WEBHOOK_VALIDATORS as WEBHOOK_REQUEST_VALIDATORS,
@@ -70,6 +74,35 @@ from openapi_core.validation.response.protocols import WebhookResponseValidator
 from openapi_core.validation.response.types import ResponseValidatorType
 from openapi_core.validation.response.types import WebhookResponseValidatorType
 
+# detected spec versions by spec object id;
+# SchemaPath equality ignores contents so it can't be used as a key
+_spec_versions: Dict[int, SpecVersion] = {}
+
+
+def _get_cached_spec_version(spec: SchemaPath) -> SpecVersion:
+    return cached_by_identity(
+        _spec_versions, spec, lambda: get_spec_version(spec.contents())
+    )
+
+
+def _check_request(request: AnyRequest, protocol: type) -> None:
+    if not supports(request, protocol):
+        raise TypeError(
+            f"'request' argument is not type of {protocol.__name__}"
+        )
+
+
+def _check_response(response: Response) -> None:
+    if not supports(response, Response):
+        raise TypeError("'response' argument is not type of Response")
+
+
+def _is_webhook_request(request: AnyRequest) -> bool:
+    if supports(request, WebhookRequest):
+        return True
+    _check_request(request, Request)
+    return False
+
 
 class OpenAPI:
     """OpenAPI class."""
@@ -117,7 +150,7 @@ class OpenAPI:
 
     def _get_version(self) -> SpecVersion:
         try:
-            return get_spec_version(self.spec.contents())
+            return _get_cached_spec_version(self.spec)
         # backward compatibility
         except OpenAPIVersionNotFound:
             raise SpecError("Spec schema version not detected")
@@ -350,89 +383,110 @@ class OpenAPI:
         )
 
     def validate_request(self, request: AnyRequest) -> None:
-        if isinstance(request, WebhookRequest):
-            self.validate_webhook_request(request)
-        else:
-            self.validate_apicall_request(request)
+        self._validate_request(request, webhook=_is_webhook_request(request))
 
     def validate_response(
         self, request: AnyRequest, response: Response
     ) -> None:
-        if isinstance(request, WebhookRequest):
-            self.validate_webhook_response(request, response)
-        else:
-            self.validate_apicall_response(request, response)
+        webhook = _is_webhook_request(request)
+        _check_response(response)
+        self._validate_response(request, response, webhook=webhook)
 
     def validate_apicall_request(self, request: Request) -> None:
-        if not isinstance(request, Request):
-            raise TypeError("'request' argument is not type of Request")
+        _check_request(request, Request)
         self.request_validator.validate(request)
 
     def validate_apicall_response(
         self, request: Request, response: Response
     ) -> None:
-        if not isinstance(request, Request):
-            raise TypeError("'request' argument is not type of Request")
-        if not isinstance(response, Response):
-            raise TypeError("'response' argument is not type of Response")
+        _check_request(request, Request)
+        _check_response(response)
         self.response_validator.validate(request, response)
 
     def validate_webhook_request(self, request: WebhookRequest) -> None:
-        if not isinstance(request, WebhookRequest):
-            raise TypeError("'request' argument is not type of WebhookRequest")
+        _check_request(request, WebhookRequest)
         self.webhook_request_validator.validate(request)
 
     def validate_webhook_response(
         self, request: WebhookRequest, response: Response
     ) -> None:
-        if not isinstance(request, WebhookRequest):
-            raise TypeError("'request' argument is not type of WebhookRequest")
-        if not isinstance(response, Response):
-            raise TypeError("'response' argument is not type of Response")
+        _check_request(request, WebhookRequest)
+        _check_response(response)
         self.webhook_response_validator.validate(request, response)
 
     def unmarshal_request(self, request: AnyRequest) -> RequestUnmarshalResult:
-        if isinstance(request, WebhookRequest):
-            return self.unmarshal_webhook_request(request)
-        else:
-            return self.unmarshal_apicall_request(request)
+        return self._unmarshal_request(
+            request, webhook=_is_webhook_request(request)
+        )
 
     def unmarshal_response(
         self, request: AnyRequest, response: Response
     ) -> ResponseUnmarshalResult:
-        if isinstance(request, WebhookRequest):
-            return self.unmarshal_webhook_response(request, response)
-        else:
-            return self.unmarshal_apicall_response(request, response)
+        webhook = _is_webhook_request(request)
+        _check_response(response)
+        return self._unmarshal_response(request, response, webhook=webhook)
 
     def unmarshal_apicall_request(
         self, request: Request
     ) -> RequestUnmarshalResult:
-        if not isinstance(request, Request):
-            raise TypeError("'request' argument is not type of Request")
+        _check_request(request, Request)
         return self.request_unmarshaller.unmarshal(request)
 
     def unmarshal_apicall_response(
         self, request: Request, response: Response
     ) -> ResponseUnmarshalResult:
-        if not isinstance(request, Request):
-            raise TypeError("'request' argument is not type of Request")
-        if not isinstance(response, Response):
-            raise TypeError("'response' argument is not type of Response")
+        _check_request(request, Request)
+        _check_response(response)
         return self.response_unmarshaller.unmarshal(request, response)
 
     def unmarshal_webhook_request(
         self, request: WebhookRequest
     ) -> RequestUnmarshalResult:
-        if not isinstance(request, WebhookRequest):
-            raise TypeError("'request' argument is not type of WebhookRequest")
+        _check_request(request, WebhookRequest)
         return self.webhook_request_unmarshaller.unmarshal(request)
 
     def unmarshal_webhook_response(
         self, request: WebhookRequest, response: Response
     ) -> ResponseUnmarshalResult:
-        if not isinstance(request, WebhookRequest):
-            raise TypeError("'request' argument is not type of WebhookRequest")
-        if not isinstance(response, Response):
-            raise TypeError("'response' argument is not type of Response")
+        _check_request(request, WebhookRequest)
+        _check_response(response)
         return self.webhook_response_unmarshaller.unmarshal(request, response)
+
+    def _validate_request(self, request: AnyRequest, webhook: bool) -> None:
+        # arguments are expected to be type checked already
+        if webhook:
+            self.webhook_request_validator.validate(
+                cast(WebhookRequest, request)
+            )
+        else:
+            self.request_validator.validate(cast(Request, request))
+
+    def _validate_response(
+        self, request: AnyRequest, response: Response, webhook: bool
+    ) -> None:
+        if webhook:
+            self.webhook_response_validator.validate(
+                cast(WebhookRequest, request), response
+            )
+        else:
+            self.response_validator.validate(cast(Request, request), response)
+
+    def _unmarshal_request(
+        self, request: AnyRequest, webhook: bool
+    ) -> RequestUnmarshalResult:
+        if webhook:
+            return self.webhook_request_unmarshaller.unmarshal(
+                cast(WebhookRequest, request)
+            )
+        return self.request_unmarshaller.unmarshal(cast(Request, request))
+
+    def _unmarshal_response(
+        self, request: AnyRequest, response: Response, webhook: bool
+    ) -> ResponseUnmarshalResult:
+        if webhook:
+            return self.webhook_response_unmarshaller.unmarshal(
+                cast(WebhookRequest, request), response
+            )
+        return self.response_unmarshaller.unmarshal(
+            cast(Request, request), response
+        )
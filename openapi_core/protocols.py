@@ -1,9 +1,15 @@
 """OpenAPI core protocols module"""
 
+import sys
+from abc import ABCMeta
 from typing import Any
+from typing import Dict
+from typing import Generic
 from typing import Mapping
 from typing import Optional
 from typing import Protocol
+from typing import Tuple
+from typing import cast
 from typing import runtime_checkable
 
 from openapi_core.datatypes import RequestParameters
@@ -124,3 +130,40 @@ class Response(Protocol):
 
     @property
     def data(self) -> Optional[bytes]: ...
+
+
+_protocol_attrs: Dict[type, Tuple[str, ...]] = {}
+
+
+def _get_protocol_attrs(protocol: type) -> Tuple[str, ...]:
+    try:
+        return _protocol_attrs[protocol]
+    except KeyError:
+        pass
+    attrs = set()
+    for base in protocol.__mro__:
+        if base in (Protocol, Generic, object):
+            continue
+        attrs.update(base.__dict__.get("__annotations__", {}))
+        attrs.update(
+            name for name in base.__dict__ if not name.startswith("_")
+        )
+    protocol_attrs = _protocol_attrs[protocol] = tuple(sorted(attrs))
+    return protocol_attrs
+
+
+def supports(obj: Any, protocol: type) -> bool:
+    """Check whether object satisfies runtime checkable protocol.
+
+    Python < 3.12 rebuilds the protocol member list on every ``isinstance``
+    call. There members are collected once and checked with ``hasattr``,
+    like typing does. Newer versions cache the members themselves and look
+    them up without running properties, so ``isinstance`` is used as is.
+    """
+    if sys.version_info >= (3, 12):
+        return isinstance(obj, protocol)
+    for attr in _get_protocol_attrs(protocol):
+        if not hasattr(obj, attr):
+            # nominal and registered subclasses
+            return ABCMeta.__instancecheck__(cast(ABCMeta, protocol), obj)
+    return True
@@ -1,13 +1,23 @@
 import warnings
+from operator import attrgetter
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
 
 from jsonschema_path import SchemaPath
 
 from openapi_core.datatypes import RequestParameters
 from openapi_core.security.exceptions import SecurityProviderError
 
+_MISSING = object()
+_AUTHORIZATION_HEADER = "Authorization"
+
 
 class BaseProvider:
+    __slots__ = ("scheme",)
+
     def __init__(self, scheme: SchemaPath):
         self.scheme = scheme
 
@@ -16,36 +26,86 @@ class BaseProvider:
 
 
 class UnsupportedProvider(BaseProvider):
+    __slots__ = ("_warned",)
+
+    def __init__(self, scheme: SchemaPath):
+        super().__init__(scheme)
+        self._warned = False
+
     def __call__(self, parameters: RequestParameters) -> Any:
-        warnings.warn("Unsupported scheme type")
+        if not self._warned:
+            warnings.warn("Unsupported scheme type")
+            self._warned = True
 
 
 class ApiKeyProvider(BaseProvider):
+    __slots__ = ("_name", "_location", "_get_source")
+
+    def __init__(self, scheme: SchemaPath):
+        super().__init__(scheme)
+        self._name = scheme["name"]
+        self._location = scheme["in"]
+        self._get_source = attrgetter(self._location)
+
     def __call__(self, parameters: RequestParameters) -> Any:
-        name = self.scheme["name"]
-        location = self.scheme["in"]
-        source = getattr(parameters, location)
-        if name not in source:
+        source = self._get_source(parameters)
+        value = source.get(self._name, _MISSING)
+        if value is _MISSING:
             raise SecurityProviderError("Missing api key parameter.")
-        return source[name]
+        return value
 
 
 class HttpProvider(BaseProvider):
+    __slots__ = ("_scheme", "_prefix", "_prefix_len")
+
+    def __init__(self, scheme: SchemaPath):
+        super().__init__(scheme)
+        self._scheme = scheme["scheme"].lower()
+        # canonical "<Scheme> " form sent by most clients
+        self._prefix = self._scheme.capitalize() + " "
+        self._prefix_len = len(self._prefix)
+
     def __call__(self, parameters: RequestParameters) -> Any:
-        if "Authorization" not in parameters.header:
+        auth_header = parameters.header.get(_AUTHORIZATION_HEADER)
+        if auth_header is None:
             raise SecurityProviderError("Missing authorization header.")
-        auth_header = parameters.header["Authorization"]
-        try:
-            auth_type, encoded_credentials = auth_header.split(" ", 1)
-        except ValueError:
+        if auth_header[: self._prefix_len] == self._prefix:
+            return auth_header[self._prefix_len :]
+        return self._parse_credentials(auth_header)
+
+    def _parse_credentials(self, auth_header: str) -> str:
+        sep_index = auth_header.find(" ")
+        if sep_index < 0:
             raise SecurityProviderError(
                 "Could not parse authorization header."
             )
 
-        scheme = self.scheme["scheme"]
-        if auth_type.lower() != scheme:
+        auth_type = auth_header[:sep_index]
+
+        if (
+            len(auth_type) != len(self._scheme)
+            or auth_type.lower() != self._scheme
+        ):
             raise SecurityProviderError(
                 f"Unknown authorization method {auth_type}"
             )
 
-        return encoded_credentials
+        return auth_header[sep_index + 1 :]
+
+
+class SecurityRequirementProvider:
+    """Provider checking all schemes of one security requirement."""
+
+    __slots__ = ("_providers",)
+
+    def __init__(
+        self,
+        providers: Iterable[Tuple[str, Callable[[RequestParameters], Any]]],
+    ):
+        self._providers = tuple(providers)
+
+    def __call__(self, parameters: RequestParameters) -> Dict[str, Any]:
+        return {
+            scheme_name: provider(parameters)
+            for scheme_name, provider in self._providers
+        }
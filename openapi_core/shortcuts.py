@@ -1,13 +1,19 @@
 """OpenAPI core shortcuts module"""
 
 from typing import Any
+from typing import Dict
+from typing import FrozenSet
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from jsonschema.validators import _UNSET
 from jsonschema_path import SchemaPath
 
 from openapi_core.app import OpenAPI
+from openapi_core.app import _check_request
+from openapi_core.app import _check_response
+from openapi_core.app import _is_webhook_request
 from openapi_core.configurations import Config
 from openapi_core.protocols import Request
 from openapi_core.protocols import Response
@@ -29,6 +35,7 @@ from openapi_core.unmarshalling.response.types import ResponseUnmarshallerType
 from openapi_core.unmarshalling.response.types import (
     WebhookResponseUnmarshallerType,
 )
+from openapi_core.util import cached_by_identity
 from openapi_core.validation.request.types import AnyRequestValidatorType
 from openapi_core.validation.request.types import RequestValidatorType
 from openapi_core.validation.request.types import WebhookRequestValidatorType
@@ -36,6 +43,36 @@ from openapi_core.validation.response.types import AnyResponseValidatorType
 from openapi_core.validation.response.types import ResponseValidatorType
 from openapi_core.validation.response.types import WebhookResponseValidatorType
 
+_openapis: Dict[int, Dict[FrozenSet[Tuple[str, Any]], OpenAPI]] = {}
+
+
+def _get_openapi(spec: SchemaPath, **config_kwargs: Any) -> OpenAPI:
+    try:
+        config_items = frozenset(config_kwargs.items())
+    except TypeError:
+        # unhashable config values can't be cached
+        return OpenAPI(spec, config=Config(**config_kwargs))
+    if not isinstance(spec, SchemaPath):
+        # let OpenAPI reject it
+        return OpenAPI(spec, config=Config(**config_kwargs))
+
+    openapis = cached_by_identity(_openapis, spec, dict)
+    try:
+        return openapis[config_items]
+    except KeyError:
+        pass
+
+    # cached instance works on a copy so it doesn't keep the spec alive
+    spec_copy = SchemaPath(
+        spec.accessor,  # type: ignore
+        *spec.parts,
+        separator=spec.separator,
+    )
+    openapi = openapis[config_items] = OpenAPI(
+        spec_copy, config=Config(**config_kwargs)
+    )
+    return openapi
+
 
 def unmarshal_apicall_request(
     request: Request,
@@ -44,12 +81,14 @@ def unmarshal_apicall_request(
     cls: Optional[RequestUnmarshallerType] = None,
     **unmarshaller_kwargs: Any,
 ) -> RequestUnmarshalResult:
-    config = Config(
+    _check_request(request, Request)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         request_unmarshaller_cls=cls or _UNSET,
         **unmarshaller_kwargs,
     )
-    result = OpenAPI(spec, config=config).unmarshal_apicall_request(request)
+    result = openapi._unmarshal_request(request, webhook=False)
     result.raise_for_errors()
     return result
 
@@ -61,12 +100,14 @@ def unmarshal_webhook_request(
     cls: Optional[WebhookRequestUnmarshallerType] = None,
     **unmarshaller_kwargs: Any,
 ) -> RequestUnmarshalResult:
-    config = Config(
+    _check_request(request, WebhookRequest)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         webhook_request_unmarshaller_cls=cls or _UNSET,
         **unmarshaller_kwargs,
     )
-    result = OpenAPI(spec, config=config).unmarshal_webhook_request(request)
+    result = openapi._unmarshal_request(request, webhook=True)
     result.raise_for_errors()
     return result
 
@@ -78,13 +119,15 @@ def unmarshal_request(
     cls: Optional[AnyRequestUnmarshallerType] = None,
     **unmarshaller_kwargs: Any,
 ) -> RequestUnmarshalResult:
-    config = Config(
+    webhook = _is_webhook_request(request)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         request_unmarshaller_cls=cls or _UNSET,
         webhook_request_unmarshaller_cls=cls or _UNSET,
         **unmarshaller_kwargs,
     )
-    result = OpenAPI(spec, config=config).unmarshal_request(request)
+    result = openapi._unmarshal_request(request, webhook=webhook)
     result.raise_for_errors()
     return result
 
@@ -97,14 +140,15 @@ def unmarshal_apicall_response(
     cls: Optional[ResponseUnmarshallerType] = None,
     **unmarshaller_kwargs: Any,
 ) -> ResponseUnmarshalResult:
-    config = Config(
+    _check_request(request, Request)
+    _check_response(response)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         response_unmarshaller_cls=cls or _UNSET,
         **unmarshaller_kwargs,
     )
-    result = OpenAPI(spec, config=config).unmarshal_apicall_response(
-        request, response
-    )
+    result = openapi._unmarshal_response(request, response, webhook=False)
     result.raise_for_errors()
     return result
 
@@ -117,14 +161,15 @@ def unmarshal_webhook_response(
     cls: Optional[WebhookResponseUnmarshallerType] = None,
     **unmarshaller_kwargs: Any,
 ) -> ResponseUnmarshalResult:
-    config = Config(
+    _check_request(request, WebhookRequest)
+    _check_response(response)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         webhook_response_unmarshaller_cls=cls or _UNSET,
         **unmarshaller_kwargs,
     )
-    result = OpenAPI(spec, config=config).unmarshal_webhook_response(
-        request, response
-    )
+    result = openapi._unmarshal_response(request, response, webhook=True)
     result.raise_for_errors()
     return result
 
@@ -137,13 +182,16 @@ def unmarshal_response(
     cls: Optional[AnyResponseUnmarshallerType] = None,
     **unmarshaller_kwargs: Any,
 ) -> ResponseUnmarshalResult:
-    config = Config(
+    webhook = _is_webhook_request(request)
+    _check_response(response)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         response_unmarshaller_cls=cls or _UNSET,
         webhook_response_unmarshaller_cls=cls or _UNSET,
         **unmarshaller_kwargs,
     )
-    result = OpenAPI(spec, config=config).unmarshal_response(request, response)
+    result = openapi._unmarshal_response(request, response, webhook=webhook)
     result.raise_for_errors()
     return result
 
@@ -155,13 +203,15 @@ def validate_request(
     cls: Optional[AnyRequestValidatorType] = None,
     **validator_kwargs: Any,
 ) -> None:
-    config = Config(
+    webhook = _is_webhook_request(request)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         request_validator_cls=cls or _UNSET,
         webhook_request_validator_cls=cls or _UNSET,
         **validator_kwargs,
     )
-    return OpenAPI(spec, config=config).validate_request(request)
+    openapi._validate_request(request, webhook=webhook)
 
 
 def validate_response(
@@ -172,13 +222,16 @@ def validate_response(
     cls: Optional[AnyResponseValidatorType] = None,
     **validator_kwargs: Any,
 ) -> None:
-    config = Config(
+    webhook = _is_webhook_request(request)
+    _check_response(response)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         response_validator_cls=cls or _UNSET,
         webhook_response_validator_cls=cls or _UNSET,
         **validator_kwargs,
     )
-    return OpenAPI(spec, config=config).validate_response(request, response)
+    openapi._validate_response(request, response, webhook=webhook)
 
 
 def validate_apicall_request(
@@ -188,12 +241,14 @@ def validate_apicall_request(
     cls: Optional[RequestValidatorType] = None,
     **validator_kwargs: Any,
 ) -> None:
-    config = Config(
+    _check_request(request, Request)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         request_validator_cls=cls or _UNSET,
         **validator_kwargs,
     )
-    return OpenAPI(spec, config=config).validate_apicall_request(request)
+    openapi._validate_request(request, webhook=False)
 
 
 def validate_webhook_request(
@@ -203,12 +258,14 @@ def validate_webhook_request(
     cls: Optional[WebhookRequestValidatorType] = None,
     **validator_kwargs: Any,
 ) -> None:
-    config = Config(
+    _check_request(request, WebhookRequest)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         webhook_request_validator_cls=cls or _UNSET,
         **validator_kwargs,
     )
-    return OpenAPI(spec, config=config).validate_webhook_request(request)
+    openapi._validate_request(request, webhook=True)
 
 
 def validate_apicall_response(
@@ -219,14 +276,15 @@ def validate_apicall_response(
     cls: Optional[ResponseValidatorType] = None,
     **validator_kwargs: Any,
 ) -> None:
-    config = Config(
+    _check_request(request, Request)
+    _check_response(response)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         response_validator_cls=cls or _UNSET,
         **validator_kwargs,
     )
-    return OpenAPI(spec, config=config).validate_apicall_response(
-        request, response
-    )
+    openapi._validate_response(request, response, webhook=False)
 
 
 def validate_webhook_response(
@@ -237,11 +295,12 @@ def validate_webhook_response(
     cls: Optional[WebhookResponseValidatorType] = None,
     **validator_kwargs: Any,
 ) -> None:
-    config = Config(
+    _check_request(request, WebhookRequest)
+    _check_response(response)
+    openapi = _get_openapi(
+        spec,
         server_base_url=base_url,
         webhook_response_validator_cls=cls or _UNSET,
         **validator_kwargs,
     )
-    return OpenAPI(spec, config=config).validate_webhook_response(
-        request, response
-    )
+    openapi._validate_response(request, response, webhook=True)
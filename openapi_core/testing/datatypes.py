@@ -4,6 +4,8 @@ from openapi_core.datatypes import Parameters
 
 
 class ResultMock:
+    __slots__ = ("body", "parameters", "data", "error_to_raise")
+
     def __init__(
         self,
         body: Optional[str] = None,
@@ -1,8 +1,14 @@
 """OpenAPI core util module"""
 
+import weakref
 from itertools import chain
 from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
 
 
 def forcebool(val: Any) -> bool:
@@ -21,3 +27,22 @@ def forcebool(val: Any) -> bool:
 def chainiters(*lists: Iterable[Any]) -> Iterable[Any]:
     iters = map(lambda l: l and iter(l) or [], lists)
     return chain(*iters)
+
+
+def cached_by_identity(
+    cache: Dict[int, T], obj: Any, factory: Callable[[], T]
+) -> T:
+    """Get value cached for obj by its identity or create it.
+
+    The entry is dropped once obj is garbage collected, so the value must
+    not reference obj itself.
+    """
+    key = id(obj)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    value = cache[key] = factory()
+    weakref.finalize(obj, cache.pop, key, None)
+    return value
@@ -4,7 +4,9 @@ import warnings
 from typing import Any
 from typing import Dict
 from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from jsonschema_path import SchemaPath
 from openapi_spec_validator import OpenAPIV30SpecValidator
@@ -35,6 +37,7 @@ from openapi_core.protocols import WebhookRequest
 from openapi_core.security import security_provider_factory
 from openapi_core.security.exceptions import SecurityProviderError
 from openapi_core.security.factories import SecurityProviderFactory
+from openapi_core.security.providers import SecurityRequirementProvider
 from openapi_core.templating.paths.exceptions import PathError
 from openapi_core.templating.paths.types import PathFinderType
 from openapi_core.templating.security.exceptions import SecurityNotFound
@@ -100,6 +103,9 @@ class BaseRequestValidator(BaseValidator):
             extra_media_type_deserializers=extra_media_type_deserializers,
         )
         self.security_provider_factory = security_provider_factory
+        self._security_providers: Dict[
+            Tuple[str, ...], SecurityRequirementProvider
+        ] = {}
 
     def _iter_errors(
         self, request: BaseRequest, operation: SchemaPath, path: SchemaPath
@@ -232,26 +238,43 @@ class BaseRequestValidator(BaseValidator):
             try:
                 scheme_names = list(security_requirement.keys())
                 schemes.append(scheme_names)
-                return {
-                    scheme_name: self._get_security_value(
-                        parameters, scheme_name
-                    )
-                    for scheme_name in scheme_names
-                }
+                return self._get_security_values(parameters, scheme_names)
             except SecurityProviderError:
                 continue
 
         raise SecurityNotFound(schemes)
 
-    def _get_security_value(
-        self, parameters: RequestParameters, scheme_name: str
-    ) -> Any:
+    def _get_security_values(
+        self, parameters: RequestParameters, scheme_names: List[str]
+    ) -> Dict[str, Any]:
+        security_provider = self._get_security_provider(tuple(scheme_names))
+        values: Dict[str, Any] = dict.fromkeys(scheme_names)
+        values.update(security_provider(parameters))
+        return values
+
+    def _get_security_provider(
+        self, scheme_names: Tuple[str, ...]
+    ) -> SecurityRequirementProvider:
+        try:
+            return self._security_providers[scheme_names]
+        except KeyError:
+            pass
+
         security_schemes = self.spec / "components#securitySchemes"
-        if scheme_name not in security_schemes:
-            return
-        scheme = security_schemes[scheme_name]
-        security_provider = self.security_provider_factory.create(scheme)
-        return security_provider(parameters)
+        schemes = {
+            scheme_name: security_schemes[scheme_name]
+            for scheme_name in scheme_names
+            if scheme_name in security_schemes
+        }
+        security_provider = SecurityRequirementProvider(
+            (
+                scheme_name,
+                self.security_provider_factory.create(scheme).__call__,
+            )
+            for scheme_name, scheme in schemes.items()
+        )
+        self._security_providers[scheme_names] = security_provider
+        return security_provider
 
     @ValidationErrorWrapper(RequestBodyValidationError, InvalidRequestBody)
     def _get_body(
@@ -6,7 +6,7 @@ import pytest
 from jsonschema_path import SchemaPath
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_v20():
     return SchemaPath.from_dict(
         {
@@ -20,7 +20,7 @@ def spec_v20():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_v30():
     return SchemaPath.from_dict(
         {
@@ -34,7 +34,7 @@ def spec_v30():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_v31():
     return SchemaPath.from_dict(
         {
@@ -48,7 +48,7 @@ def spec_v31():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_invalid():
     return SchemaPath.from_dict({})
 
@@ -0,0 +1,30 @@
+import pytest
+from jsonschema_path import SchemaPath
+
+from openapi_core.security.factories import SecurityProviderFactory
+from openapi_core.security.providers import ApiKeyProvider
+from openapi_core.security.providers import HttpProvider
+
+
+class TestSecurityProviderFactory:
+    @pytest.fixture
+    def factory(self):
+        return SecurityProviderFactory()
+
+    @pytest.mark.parametrize(
+        "spec,provider_class",
+        [
+            (
+                {"type": "apiKey", "name": "X-API-Key", "in": "header"},
+                ApiKeyProvider,
+            ),
+            ({"type": "http", "scheme": "basic"}, HttpProvider),
+            ({"type": "http", "scheme": "bearer"}, HttpProvider),
+        ],
+    )
+    def test_create(self, factory, spec, provider_class):
+        scheme = SchemaPath.from_dict(spec)
+
+        result = factory.create(scheme)
+
+        assert type(result) is provider_class
@@ -1,7 +1,11 @@
 import pytest
 from jsonschema_path import SchemaPath
 
+from openapi_core.security.exceptions import SecurityProviderError
+from openapi_core.security.providers import ApiKeyProvider
 from openapi_core.security.providers import HttpProvider
+from openapi_core.security.providers import SecurityRequirementProvider
+from openapi_core.security.providers import UnsupportedProvider
 from openapi_core.testing import MockRequest
 
 
@@ -38,3 +42,189 @@ class TestHttpProvider:
         result = provider(request.parameters)
 
         assert result == value
+
+    @pytest.mark.parametrize(
+        "auth_type",
+        ["Bearer", "bearer", "BEARER"],
+    )
+    def test_header_auth_type_case(self, auth_type):
+        spec = {
+            "type": "http",
+            "scheme": "bearer",
+        }
+        headers = {
+            "Authorization": " ".join([auth_type, "MQ"]),
+        }
+        request = MockRequest(
+            "http://localhost",
+            "GET",
+            "/pets",
+            headers=headers,
+        )
+        scheme = SchemaPath.from_dict(spec)
+        provider = HttpProvider(scheme)
+
+        result = provider(request.parameters)
+
+        assert result == "MQ"
+
+    @pytest.mark.parametrize(
+        "auth_header",
+        ["", "Basic", "BasicMQ"],
+    )
+    def test_header_invalid(self, auth_header):
+        spec = {
+            "type": "http",
+            "scheme": "basic",
+        }
+        headers = {
+            "Authorization": auth_header,
+        }
+        request = MockRequest(
+            "http://localhost",
+            "GET",
+            "/pets",
+            headers=headers,
+        )
+        scheme = SchemaPath.from_dict(spec)
+        provider = HttpProvider(scheme)
+
+        with pytest.raises(SecurityProviderError):
+            provider(request.parameters)
+
+    def test_header_unknown_method(self):
+        spec = {
+            "type": "http",
+            "scheme": "basic",
+        }
+        headers = {
+            "Authorization": "Bearer MQ",
+        }
+        request = MockRequest(
+            "http://localhost",
+            "GET",
+            "/pets",
+            headers=headers,
+        )
+        scheme = SchemaPath.from_dict(spec)
+        provider = HttpProvider(scheme)
+
+        with pytest.raises(SecurityProviderError) as exc_info:
+            provider(request.parameters)
+
+        assert str(exc_info.value) == "Unknown authorization method Bearer"
+
+
+class TestApiKeyProvider:
+    @pytest.mark.parametrize(
+        "location,request_kwargs",
+        [
+            ("header", {"headers": {"X-API-Key": "MQ"}}),
+            ("query", {"args": {"X-API-Key": "MQ"}}),
+            ("cookie", {"cookies": {"X-API-Key": "MQ"}}),
+        ],
+    )
+    def test_valid(self, location, request_kwargs):
+        spec = {
+            "type": "apiKey",
+            "name": "X-API-Key",
+            "in": location,
+        }
+        request = MockRequest(
+            "http://localhost",
+            "GET",
+            "/pets",
+            **request_kwargs,
+        )
+        scheme = SchemaPath.from_dict(spec)
+        provider = ApiKeyProvider(scheme)
+
+        result = provider(request.parameters)
+
+        assert result == "MQ"
+
+    def test_missing(self):
+        spec = {
+            "type": "apiKey",
+            "name": "X-API-Key",
+            "in": "header",
+        }
+        request = MockRequest("http://localhost", "GET", "/pets")
+        scheme = SchemaPath.from_dict(spec)
+        provider = ApiKeyProvider(scheme)
+
+        with pytest.raises(SecurityProviderError):
+            provider(request.parameters)
+
+
+class TestUnsupportedProvider:
+    def test_warns_once(self):
+        spec = {
+            "type": "oauth2",
+            "flows": {},
+        }
+        request = MockRequest("http://localhost", "GET", "/pets")
+        scheme = SchemaPath.from_dict(spec)
+        provider = UnsupportedProvider(scheme)
+
+        with pytest.warns(UserWarning) as record:
+            result = provider(request.parameters)
+            provider(request.parameters)
+
+        assert result is None
+        assert len(record) == 1
+
+
+class TestSecurityRequirementProvider:
+    def test_all_schemes(self):
+        api_key_spec = {
+            "type": "apiKey",
+            "name": "X-API-Key",
+            "in": "header",
+        }
+        http_spec = {
+            "type": "http",
+            "scheme": "bearer",
+        }
+        headers = {
+            "X-API-Key": "MQ",
+            "Authorization": "Bearer Mg",
+        }
+        request = MockRequest(
+            "http://localhost",
+            "GET",
+            "/pets",
+            headers=headers,
+        )
+        provider = SecurityRequirementProvider(
+            [
+                (
+                    "api_key",
+                    ApiKeyProvider(SchemaPath.from_dict(api_key_spec)),
+                ),
+                ("bearer", HttpProvider(SchemaPath.from_dict(http_spec))),
+            ]
+        )
+
+        result = provider(request.parameters)
+
+        assert result == {"api_key": "MQ", "bearer": "Mg"}
+
+    def test_scheme_error(self):
+        api_key_spec = {
+            "type": "apiKey",
+            "name": "X-API-Key",
+            "in": "header",
+        }
+        request = MockRequest("http://localhost", "GET", "/pets")
+        provider = SecurityRequirementProvider(
+            [
+                (
+                    "api_key",
+                    ApiKeyProvider(SchemaPath.from_dict(api_key_spec)),
+                ),
+            ]
+        )
+
+        with pytest.raises(SecurityProviderError):
+            provider(request.parameters)
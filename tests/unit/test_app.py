@@ -1,9 +1,13 @@
+import gc
 from pathlib import Path
+from unittest import mock
 
 import pytest
+from jsonschema_path import SchemaPath
 
 from openapi_core import Config
 from openapi_core import OpenAPI
+from openapi_core import app
 from openapi_core.exceptions import SpecError
 
 
@@ -75,3 +79,40 @@ class TestOpenAPIFromDict:
 
         assert type(result) == OpenAPI
         assert result.spec.contents() == spec_dict
+
+
+class TestOpenAPIVersion:
+    def test_cached_per_spec(self, spec_v30, spec_v31):
+        config = Config(spec_validator_cls=None)
+
+        result_v30 = OpenAPI(spec_v30, config=config).version
+        result_v31 = OpenAPI(spec_v31, config=config).version
+        result_v30_cached = OpenAPI(spec_v30, config=config).version
+
+        assert result_v30.minor == "0"
+        assert result_v31.minor == "1"
+        assert result_v30_cached == result_v30
+
+    def test_detected_once_per_spec(self):
+        spec = SchemaPath.from_dict({"openapi": "3.0.0"})
+        config = Config(spec_validator_cls=None)
+
+        with mock.patch.object(
+            app, "get_spec_version", wraps=app.get_spec_version
+        ) as mock_get_spec_version:
+            OpenAPI(spec, config=config).version
+            OpenAPI(spec, config=config).version
+
+        mock_get_spec_version.assert_called_once_with(spec.contents())
+
+    def test_cache_cleared_with_spec(self):
+        spec = SchemaPath.from_dict({"openapi": "3.0.0"})
+        config = Config(spec_validator_cls=None)
+        OpenAPI(spec, config=config).version
+        key = id(spec)
+        assert key in app._spec_versions
+
+        del spec
+        gc.collect()
+
+        assert key not in app._spec_versions
@@ -0,0 +1,67 @@
+import sys
+from unittest import mock
+
+import pytest
+
+from openapi_core.protocols import Request
+from openapi_core.protocols import Response
+from openapi_core.protocols import WebhookRequest
+from openapi_core.protocols import supports
+from openapi_core.testing import MockRequest
+from openapi_core.testing import MockResponse
+
+
+class TestSupports:
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            MockRequest("http://localhost", "GET", "/pets"),
+            MockResponse(b""),
+            mock.Mock(spec=Request),
+            mock.Mock(spec=WebhookRequest),
+            mock.Mock(spec=Response),
+            mock.sentinel.obj,
+            object(),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "protocol",
+        [Request, WebhookRequest, Response],
+    )
+    def test_same_as_isinstance(self, obj, protocol):
+        result = supports(obj, protocol)
+
+        assert result is isinstance(obj, protocol)
+
+    def test_nominal_subclass(self):
+        class BodylessWebhookRequest(WebhookRequest):
+            @property
+            def body(self):
+                raise AttributeError("body")
+
+        request = BodylessWebhookRequest()
+        assert not hasattr(request, "body")
+
+        result = supports(request, WebhookRequest)
+
+        assert result is True
+        assert result is isinstance(request, WebhookRequest)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 12),
+        reason="protocol members are looked up statically since 3.12",
+    )
+    def test_property_not_called(self):
+        class StreamReadRequest:
+            name = "test"
+            method = "post"
+            content_type = "application/json"
+            parameters = None
+
+            @property
+            def body(self):
+                raise RuntimeError("stream already read")
+
+        result = supports(StreamReadRequest(), WebhookRequest)
+
+        assert result is True
@@ -1,8 +1,16 @@
+import gc
+import weakref
 from unittest import mock
 
 import pytest
+from jsonschema_path import SchemaPath
 from openapi_spec_validator import OpenAPIV31SpecValidator
 
+from openapi_core import OpenAPI
+from openapi_core import V31WebhookRequestValidator
+from openapi_core import V31WebhookResponseValidator
+from openapi_core import app
+from openapi_core import shortcuts
 from openapi_core import unmarshal_apicall_request
 from openapi_core import unmarshal_apicall_response
 from openapi_core import unmarshal_request
@@ -19,6 +27,7 @@ from openapi_core.exceptions import SpecError
 from openapi_core.protocols import Request
 from openapi_core.protocols import Response
 from openapi_core.protocols import WebhookRequest
+from openapi_core.protocols import supports
 from openapi_core.testing.datatypes import ResultMock
 from openapi_core.unmarshalling.request.datatypes import RequestUnmarshalResult
 from openapi_core.unmarshalling.request.unmarshallers import (
@@ -46,21 +55,30 @@ from openapi_core.validation.response.validators import (
 )
 
 
+@pytest.fixture(autouse=True)
+def openapis_cache_clear():
+    yield
+    # session scoped specs would otherwise share instances across tests
+    shortcuts._openapis.clear()
+
+
+# raises a fresh ValueError on each raise_for_errors call
+VALUE_ERROR_RESULT = ResultMock(error_to_raise=ValueError)
+
+
 class MockClass:
     spec_validator_cls = None
     schema_casters_factory = None
     schema_validators_factory = None
     schema_unmarshallers_factory = None
 
-    unmarshal_calls = []
-    validate_calls = []
     return_unmarshal = None
 
-    @classmethod
-    def setUp(cls, return_unmarshal=None):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # every created class records its own calls
         cls.unmarshal_calls = []
         cls.validate_calls = []
-        cls.return_unmarshal = return_unmarshal
 
 
 class MockReqValidator(MockClass):
@@ -85,131 +103,207 @@ class MockRespUnmarshaller(MockClass):
         return self.return_unmarshal
 
 
-@pytest.fixture(autouse=True)
-def setup():
-    MockClass.setUp()
-    yield
+REQUEST_SHORTCUTS = [
+    pytest.param(
+        unmarshal_apicall_request, Request, id="unmarshal_apicall_request"
+    ),
+    pytest.param(
+        unmarshal_webhook_request,
+        WebhookRequest,
+        id="unmarshal_webhook_request",
+    ),
+    pytest.param(unmarshal_request, Request, id="unmarshal_request-apicall"),
+    pytest.param(
+        unmarshal_request, WebhookRequest, id="unmarshal_request-webhook"
+    ),
+    pytest.param(
+        validate_apicall_request, Request, id="validate_apicall_request"
+    ),
+    pytest.param(
+        validate_webhook_request,
+        WebhookRequest,
+        id="validate_webhook_request",
+    ),
+    pytest.param(validate_request, Request, id="validate_request-apicall"),
+    pytest.param(
+        validate_request, WebhookRequest, id="validate_request-webhook"
+    ),
+]
+
+RESPONSE_SHORTCUTS = [
+    pytest.param(
+        unmarshal_apicall_response, Request, id="unmarshal_apicall_response"
+    ),
+    pytest.param(
+        unmarshal_webhook_response,
+        WebhookRequest,
+        id="unmarshal_webhook_response",
+    ),
+    pytest.param(unmarshal_response, Request, id="unmarshal_response-apicall"),
+    pytest.param(
+        unmarshal_response, WebhookRequest, id="unmarshal_response-webhook"
+    ),
+    pytest.param(
+        validate_apicall_response, Request, id="validate_apicall_response"
+    ),
+    pytest.param(
+        validate_webhook_response,
+        WebhookRequest,
+        id="validate_webhook_response",
+    ),
+    pytest.param(validate_response, Request, id="validate_response-apicall"),
+    pytest.param(
+        validate_response, WebhookRequest, id="validate_response-webhook"
+    ),
+]
+
+
+def webhook_shortcuts(shortcuts):
+    return [param for param in shortcuts if param.values[1] is WebhookRequest]
+
+
+@pytest.mark.parametrize("shortcut,request_type", REQUEST_SHORTCUTS)
+class TestRequestShortcutErrors:
+    def test_spec_not_detected(self, shortcut, request_type, spec_invalid):
+        request = mock.Mock(spec=request_type)
 
+        with pytest.raises(SpecError):
+            shortcut(request, spec=spec_invalid)
 
-class TestUnmarshalAPICallRequest:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
+    def test_spec_not_supported(self, shortcut, request_type, spec_v20):
+        request = mock.Mock(spec=request_type)
 
         with pytest.raises(SpecError):
-            unmarshal_apicall_request(request, spec=spec_invalid)
+            shortcut(request, spec=spec_v20)
 
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
+    def test_request_type_invalid(self, shortcut, request_type, spec_v31):
+        request = mock.sentinel.request
 
-        with pytest.raises(SpecError):
-            unmarshal_apicall_request(request, spec=spec_v20)
+        with pytest.raises(TypeError):
+            shortcut(request, spec=spec_v31)
 
-    def test_request_type_invalid(self, spec_v31):
+    def test_request_type_checked_before_spec(
+        self, shortcut, request_type, spec_invalid
+    ):
         request = mock.sentinel.request
 
         with pytest.raises(TypeError):
-            unmarshal_apicall_request(request, spec=spec_v31)
+            shortcut(request, spec=spec_invalid)
 
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
+    def test_spec_type_invalid(self, shortcut, request_type):
+        request = mock.Mock(spec=request_type)
         spec = mock.sentinel.spec
 
         with pytest.raises(TypeError):
-            unmarshal_apicall_request(request, spec=spec)
+            shortcut(request, spec=spec)
 
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
+    def test_cls_type_invalid(self, shortcut, request_type, spec_v31):
+        request = mock.Mock(spec=request_type)
 
         with pytest.raises(TypeError):
-            unmarshal_apicall_request(request, spec=spec_v31, cls=Exception)
+            shortcut(request, spec=spec_v31, cls=Exception)
 
 
-class TestUnmarshalWebhookRequest:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=WebhookRequest)
+@pytest.mark.parametrize(
+    "shortcut,request_type", webhook_shortcuts(REQUEST_SHORTCUTS)
+)
+def test_request_shortcut_oas30_validator_not_found(
+    shortcut, request_type, spec_v30
+):
+    request = mock.Mock(spec=request_type)
+
+    with pytest.raises(SpecError):
+        shortcut(request, spec=spec_v30)
+
+
+@pytest.mark.parametrize("shortcut,request_type", RESPONSE_SHORTCUTS)
+class TestResponseShortcutErrors:
+    def test_spec_not_detected(self, shortcut, request_type, spec_invalid):
+        request = mock.Mock(spec=request_type)
+        response = mock.Mock(spec=Response)
 
         with pytest.raises(SpecError):
-            unmarshal_webhook_request(request, spec=spec_invalid)
+            shortcut(request, response, spec=spec_invalid)
 
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=WebhookRequest)
+    def test_spec_not_supported(self, shortcut, request_type, spec_v20):
+        request = mock.Mock(spec=request_type)
+        response = mock.Mock(spec=Response)
 
         with pytest.raises(SpecError):
-            unmarshal_webhook_request(request, spec=spec_v20)
+            shortcut(request, response, spec=spec_v20)
 
-    def test_request_type_invalid(self, spec_v31):
+    def test_request_type_invalid(self, shortcut, request_type, spec_v31):
         request = mock.sentinel.request
+        response = mock.Mock(spec=Response)
 
         with pytest.raises(TypeError):
-            unmarshal_webhook_request(request, spec=spec_v31)
+            shortcut(request, response, spec=spec_v31)
 
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=WebhookRequest)
-        spec = mock.sentinel.spec
+    def test_response_type_invalid(self, shortcut, request_type, spec_v31):
+        request = mock.Mock(spec=request_type)
+        response = mock.sentinel.response
 
         with pytest.raises(TypeError):
-            unmarshal_webhook_request(request, spec=spec)
+            shortcut(request, response, spec=spec_v31)
 
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
+    def test_response_type_checked_before_spec(
+        self, shortcut, request_type, spec_invalid
+    ):
+        request = mock.Mock(spec=request_type)
+        response = mock.sentinel.response
 
         with pytest.raises(TypeError):
-            unmarshal_webhook_request(request, spec=spec_v31, cls=Exception)
+            shortcut(request, response, spec=spec_invalid)
 
-    def test_spec_oas30_validator_not_found(self, spec_v30):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(SpecError):
-            unmarshal_webhook_request(request, spec=spec_v30)
-
-    @mock.patch(
-        "openapi_core.unmarshalling.request.unmarshallers.WebhookRequestUnmarshaller."
-        "unmarshal",
-    )
-    def test_request(self, mock_unmarshal, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
+    def test_spec_type_invalid(self, shortcut, request_type):
+        request = mock.Mock(spec=request_type)
+        response = mock.Mock(spec=Response)
+        spec = mock.sentinel.spec
 
-        result = unmarshal_webhook_request(request, spec=spec_v31)
+        with pytest.raises(TypeError):
+            shortcut(request, response, spec=spec)
 
-        assert result == mock_unmarshal.return_value
-        mock_unmarshal.assert_called_once_with(request)
+    def test_cls_type_invalid(self, shortcut, request_type, spec_v31):
+        request = mock.Mock(spec=request_type)
+        response = mock.Mock(spec=Response)
 
+        with pytest.raises(TypeError):
+            shortcut(request, response, spec=spec_v31, cls=Exception)
 
-class TestUnmarshalRequest:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
 
-        with pytest.raises(SpecError):
-            unmarshal_request(request, spec=spec_invalid)
+@pytest.mark.parametrize(
+    "shortcut,request_type", webhook_shortcuts(RESPONSE_SHORTCUTS)
+)
+def test_response_shortcut_oas30_validator_not_found(
+    shortcut, request_type, spec_v30
+):
+    request = mock.Mock(spec=request_type)
+    response = mock.Mock(spec=Response)
 
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
+    with pytest.raises(SpecError):
+        shortcut(request, response, spec=spec_v30)
 
-        with pytest.raises(SpecError):
-            unmarshal_request(request, spec=spec_v20)
 
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
+class TestUnmarshalWebhookRequest:
+    @mock.patch.object(WebhookRequestUnmarshaller, "unmarshal")
+    def test_request(self, mock_unmarshal, spec_v31):
+        request = mock.Mock(spec=WebhookRequest)
 
-        with pytest.raises(TypeError):
-            unmarshal_request(request, spec=spec_v31)
+        result = unmarshal_webhook_request(request, spec=spec_v31)
 
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
-        spec = mock.sentinel.spec
+        assert result is mock_unmarshal.return_value
+        mock_unmarshal.assert_called_once_with(request)
 
-        with pytest.raises(TypeError):
-            unmarshal_request(request, spec=spec)
 
+class TestUnmarshalRequest:
     def test_cls_apicall_unmarshaller(self, spec_v31):
         request = mock.Mock(spec=Request)
         unmarshal = mock.Mock(spec=RequestUnmarshalResult)
         TestAPICallReq = type(
             "TestAPICallReq",
             (MockReqUnmarshaller, APICallRequestUnmarshaller),
-            {},
+            {"return_unmarshal": unmarshal},
         )
-        TestAPICallReq.setUp(unmarshal)
 
         result = unmarshal_request(request, spec=spec_v31, cls=TestAPICallReq)
 
@@ -224,9 +318,8 @@ class TestUnmarshalRequest:
         TestWebhookReq = type(
             "TestWebhookReq",
             (MockReqUnmarshaller, WebhookRequestUnmarshaller),
-            {},
+            {"return_unmarshal": unmarshal},
         )
-        TestWebhookReq.setUp(unmarshal)
 
         result = unmarshal_request(request, spec=spec_v31, cls=TestWebhookReq)
 
@@ -235,32 +328,19 @@ class TestUnmarshalRequest:
             (request,),
         ]
 
-    @pytest.mark.parametrize("req", [Request, WebhookRequest])
-    def test_cls_type_invalid(self, spec_v31, req):
-        request = mock.Mock(spec=req)
-
-        with pytest.raises(TypeError):
-            unmarshal_request(request, spec=spec_v31, cls=Exception)
-
-    @mock.patch(
-        "openapi_core.unmarshalling.request.unmarshallers.APICallRequestUnmarshaller."
-        "unmarshal",
-    )
+    @mock.patch.object(APICallRequestUnmarshaller, "unmarshal")
     def test_request(self, mock_unmarshal, spec_v31):
         request = mock.Mock(spec=Request)
 
         result = unmarshal_request(request, spec=spec_v31)
 
-        assert result == mock_unmarshal.return_value
+        assert result is mock_unmarshal.return_value
         mock_unmarshal.assert_called_once_with(request)
 
-    @mock.patch(
-        "openapi_core.unmarshalling.request.unmarshallers.APICallRequestUnmarshaller."
-        "unmarshal",
-    )
+    @mock.patch.object(APICallRequestUnmarshaller, "unmarshal")
     def test_request_error(self, mock_unmarshal, spec_v31):
         request = mock.Mock(spec=Request)
-        mock_unmarshal.return_value = ResultMock(error_to_raise=ValueError)
+        mock_unmarshal.return_value = VALUE_ERROR_RESULT
 
         with pytest.raises(ValueError):
             unmarshal_request(request, spec=spec_v31)
@@ -268,90 +348,7 @@ class TestUnmarshalRequest:
         mock_unmarshal.assert_called_once_with(request)
 
 
-class TestUnmarshalAPICallResponse:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_apicall_response(request, response, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_apicall_response(request, response, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            unmarshal_apicall_response(request, response, spec=spec_v31)
-
-    def test_response_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.sentinel.response
-
-        with pytest.raises(TypeError):
-            unmarshal_apicall_response(request, response, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            unmarshal_apicall_response(request, response, spec=spec)
-
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            unmarshal_apicall_response(
-                request, response, spec=spec_v31, cls=Exception
-            )
-
-
 class TestUnmarshalResponse:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_response(request, response, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_response(request, response, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            unmarshal_response(request, response, spec=spec_v31)
-
-    def test_response_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.sentinel.response
-
-        with pytest.raises(TypeError):
-            unmarshal_response(request, response, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            unmarshal_response(request, response, spec=spec)
-
     def test_cls_apicall_unmarshaller(self, spec_v31):
         request = mock.Mock(spec=Request)
         response = mock.Mock(spec=Response)
@@ -359,9 +356,8 @@ class TestUnmarshalResponse:
         TestAPICallReq = type(
             "TestAPICallReq",
             (MockRespUnmarshaller, APICallResponseUnmarshaller),
-            {},
+            {"return_unmarshal": unmarshal},
         )
-        TestAPICallReq.setUp(unmarshal)
 
         result = unmarshal_response(
             request, response, spec=spec_v31, cls=TestAPICallReq
@@ -379,9 +375,8 @@ class TestUnmarshalResponse:
         TestWebhookReq = type(
             "TestWebhookReq",
             (MockRespUnmarshaller, WebhookResponseUnmarshaller),
-            {},
+            {"return_unmarshal": unmarshal},
         )
-        TestWebhookReq.setUp(unmarshal)
 
         result = unmarshal_response(
             request, response, spec=spec_v31, cls=TestWebhookReq
@@ -392,35 +387,21 @@ class TestUnmarshalResponse:
             (request, response),
         ]
 
-    @pytest.mark.parametrize("req", [Request, WebhookRequest])
-    def test_cls_type_invalid(self, spec_v31, req):
-        request = mock.Mock(spec=req)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            unmarshal_response(request, response, spec=spec_v31, cls=Exception)
-
-    @mock.patch(
-        "openapi_core.unmarshalling.response.unmarshallers.APICallResponseUnmarshaller."
-        "unmarshal",
-    )
+    @mock.patch.object(APICallResponseUnmarshaller, "unmarshal")
     def test_request_response(self, mock_unmarshal, spec_v31):
         request = mock.Mock(spec=Request)
         response = mock.Mock(spec=Response)
 
         result = unmarshal_response(request, response, spec=spec_v31)
 
-        assert result == mock_unmarshal.return_value
+        assert result is mock_unmarshal.return_value
         mock_unmarshal.assert_called_once_with(request, response)
 
-    @mock.patch(
-        "openapi_core.unmarshalling.response.unmarshallers.APICallResponseUnmarshaller."
-        "unmarshal",
-    )
+    @mock.patch.object(APICallResponseUnmarshaller, "unmarshal")
     def test_request_response_error(self, mock_unmarshal, spec_v31):
         request = mock.Mock(spec=Request)
         response = mock.Mock(spec=Response)
-        mock_unmarshal.return_value = ResultMock(error_to_raise=ValueError)
+        mock_unmarshal.return_value = VALUE_ERROR_RESULT
 
         with pytest.raises(ValueError):
             unmarshal_response(request, response, spec=spec_v31)
@@ -429,108 +410,19 @@ class TestUnmarshalResponse:
 
 
 class TestUnmarshalWebhookResponse:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_webhook_response(request, response, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_webhook_response(request, response, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            unmarshal_webhook_response(request, response, spec=spec_v31)
-
-    def test_response_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.sentinel.response
-
-        with pytest.raises(TypeError):
-            unmarshal_webhook_response(request, response, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            unmarshal_webhook_response(request, response, spec=spec)
-
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            unmarshal_webhook_response(
-                request, response, spec=spec_v31, cls=Exception
-            )
-
-    def test_spec_oas30_validator_not_found(self, spec_v30):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            unmarshal_webhook_response(request, response, spec=spec_v30)
-
-    @mock.patch(
-        "openapi_core.unmarshalling.response.unmarshallers.WebhookResponseUnmarshaller."
-        "unmarshal",
-    )
+    @mock.patch.object(WebhookResponseUnmarshaller, "unmarshal")
     def test_request_response(self, mock_unmarshal, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
         response = mock.Mock(spec=Response)
 
         result = unmarshal_webhook_response(request, response, spec=spec_v31)
 
-        assert result == mock_unmarshal.return_value
+        assert result is mock_unmarshal.return_value
         mock_unmarshal.assert_called_once_with(request, response)
 
 
 class TestValidateAPICallRequest:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
-
-        with pytest.raises(SpecError):
-            validate_apicall_request(request, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
-
-        with pytest.raises(SpecError):
-            validate_apicall_request(request, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-
-        with pytest.raises(TypeError):
-            validate_apicall_request(request, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            validate_apicall_request(request, spec=spec)
-
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-
-        with pytest.raises(TypeError):
-            validate_apicall_request(request, spec=spec_v31, cls=Exception)
-
-    @mock.patch(
-        "openapi_core.validation.request.validators.APICallRequestValidator."
-        "validate",
-    )
+    @mock.patch.object(APICallRequestValidator, "validate")
     def test_request(self, mock_validate, spec_v31):
         request = mock.Mock(spec=Request)
 
@@ -541,47 +433,7 @@ class TestValidateAPICallRequest:
 
 
 class TestValidateWebhookRequest:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(SpecError):
-            validate_webhook_request(request, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(SpecError):
-            validate_webhook_request(request, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-
-        with pytest.raises(TypeError):
-            validate_webhook_request(request, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=WebhookRequest)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            validate_webhook_request(request, spec=spec)
-
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(TypeError):
-            validate_webhook_request(request, spec=spec_v31, cls=Exception)
-
-    def test_spec_oas30_validator_not_found(self, spec_v30):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(SpecError):
-            validate_webhook_request(request, spec=spec_v30)
-
-    @mock.patch(
-        "openapi_core.validation.request.validators.WebhookRequestValidator."
-        "validate",
-    )
+    @mock.patch.object(WebhookRequestValidator, "validate")
     def test_request(self, mock_validate, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
 
@@ -592,44 +444,48 @@ class TestValidateWebhookRequest:
 
 
 class TestValidateRequest:
-    def test_spec_invalid(self, spec_invalid):
-        request = mock.Mock(spec=Request)
-
-        with pytest.raises(SpecError):
-            validate_request(request, spec=spec_invalid)
-
-    def test_spec_not_detected(self, spec_v20):
+    @mock.patch.object(APICallRequestValidator, "validate")
+    def test_request(self, mock_validate, spec_v31):
         request = mock.Mock(spec=Request)
+        mock_validate.return_value = None
 
-        with pytest.raises(SpecError):
-            validate_request(request, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
+        validate_request(request, spec=spec_v31)
 
-        with pytest.raises(TypeError):
-            validate_request(request, spec=spec_v31)
+        mock_validate.assert_called_once_with(request)
 
-    def test_spec_type_invalid(self):
+    def test_cls_apicall(self, spec_v31):
         request = mock.Mock(spec=Request)
-        spec = mock.sentinel.spec
+        TestAPICallReq = type(
+            "TestAPICallReq",
+            (MockReqValidator, APICallRequestValidator),
+            {},
+        )
 
-        with pytest.raises(TypeError):
-            validate_request(request, spec=spec)
+        result = validate_request(request, spec=spec_v31, cls=TestAPICallReq)
 
-    @mock.patch(
-        "openapi_core.validation.request.validators.APICallRequestValidator."
-        "validate",
-    )
-    def test_request(self, mock_validate, spec_v31):
+        assert result is None
+        assert TestAPICallReq.validate_calls == [
+            (request,),
+        ]
+
+    @mock.patch.object(app, "supports", wraps=supports)
+    @mock.patch.object(APICallRequestValidator, "validate")
+    def test_request_checked_once(
+        self, mock_validate, mock_supports, spec_v31
+    ):
         request = mock.Mock(spec=Request)
         mock_validate.return_value = None
 
         validate_request(request, spec=spec_v31)
 
+        assert mock_supports.call_args_list == [
+            mock.call(request, WebhookRequest),
+            mock.call(request, Request),
+        ]
         mock_validate.assert_called_once_with(request)
 
-    def test_cls_apicall(self, spec_v31):
+    @mock.patch.object(OpenAPI, "check_spec")
+    def test_cls_reused(self, mock_check_spec, spec_v31):
         request = mock.Mock(spec=Request)
         TestAPICallReq = type(
             "TestAPICallReq",
@@ -637,13 +493,68 @@ class TestValidateRequest:
             {},
         )
 
-        result = validate_request(request, spec=spec_v31, cls=TestAPICallReq)
+        validate_request(request, spec=spec_v31, cls=TestAPICallReq)
+        validate_request(request, spec=spec_v31, cls=TestAPICallReq)
 
-        assert result is None
+        mock_check_spec.assert_called_once_with()
         assert TestAPICallReq.validate_calls == [
             (request,),
+            (request,),
         ]
 
+    @mock.patch.object(OpenAPI, "check_spec")
+    def test_unhashable_config_not_reused(self, mock_check_spec, spec_v31):
+        request = mock.Mock(spec=Request)
+        TestAPICallReq = type(
+            "TestAPICallReq",
+            (MockReqValidator, APICallRequestValidator),
+            {},
+        )
+        extra_format_validators = {"custom": lambda value: True}
+
+        validate_request(
+            request,
+            spec=spec_v31,
+            cls=TestAPICallReq,
+            extra_format_validators=extra_format_validators,
+        )
+        validate_request(
+            request,
+            spec=spec_v31,
+            cls=TestAPICallReq,
+            extra_format_validators=extra_format_validators,
+        )
+
+        assert mock_check_spec.call_count == 2
+        assert TestAPICallReq.validate_calls == [
+            (request,),
+            (request,),
+        ]
+
+    @mock.patch.object(APICallRequestValidator, "validate")
+    def test_spec_not_kept_alive(self, mock_validate):
+        spec = SchemaPath.from_dict(
+            {
+                "openapi": "3.1.0",
+                "info": {
+                    "title": "Spec",
+                    "version": "0.0.1",
+                },
+                "paths": {},
+            }
+        )
+        request = mock.Mock(spec=Request)
+        validate_request(request, spec=spec)
+        spec_ref = weakref.ref(spec)
+        key = id(spec)
+        assert key in shortcuts._openapis
+
+        del spec
+        gc.collect()
+
+        assert spec_ref() is None
+        assert key not in shortcuts._openapis
+
     def test_cls_apicall_with_spec_validator_cls(self, spec_v31):
         request = mock.Mock(spec=Request)
         TestAPICallReq = type(
@@ -708,16 +619,7 @@ class TestValidateRequest:
             (request,),
         ]
 
-    def test_cls_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-
-        with pytest.raises(TypeError):
-            validate_request(request, spec=spec_v31, cls=Exception)
-
-    @mock.patch(
-        "openapi_core.validation.request.validators.V31WebhookRequestValidator."
-        "validate",
-    )
+    @mock.patch.object(V31WebhookRequestValidator, "validate")
     def test_webhook_request(self, mock_validate, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
         mock_validate.return_value = None
@@ -726,16 +628,7 @@ class TestValidateRequest:
 
         mock_validate.assert_called_once_with(request)
 
-    def test_webhook_request_validator_not_found(self, spec_v30):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(SpecError):
-            validate_request(request, spec=spec_v30)
-
-    @mock.patch(
-        "openapi_core.validation.request.validators.V31WebhookRequestValidator."
-        "validate",
-    )
+    @mock.patch.object(V31WebhookRequestValidator, "validate")
     def test_webhook_request_error(self, mock_validate, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
         mock_validate.side_effect = ValueError
@@ -745,63 +638,9 @@ class TestValidateRequest:
 
         mock_validate.assert_called_once_with(request)
 
-    def test_webhook_cls_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-
-        with pytest.raises(TypeError):
-            validate_request(request, spec=spec_v31, cls=Exception)
-
 
 class TestValidateAPICallResponse:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_apicall_response(request, response, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_apicall_response(request, response, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_apicall_response(request, response, spec=spec_v31)
-
-    def test_response_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.sentinel.response
-
-        with pytest.raises(TypeError):
-            validate_apicall_response(request, response, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            validate_apicall_response(request, response, spec=spec)
-
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_apicall_response(
-                request, response, spec=spec_v31, cls=Exception
-            )
-
-    @mock.patch(
-        "openapi_core.validation.response.validators.APICallResponseValidator."
-        "validate",
-    )
+    @mock.patch.object(APICallResponseValidator, "validate")
     def test_request_response(self, mock_validate, spec_v31):
         request = mock.Mock(spec=Request)
         response = mock.Mock(spec=Response)
@@ -813,62 +652,7 @@ class TestValidateAPICallResponse:
 
 
 class TestValidateWebhookResponse:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_webhook_response(request, response, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_webhook_response(request, response, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_webhook_response(request, response, spec=spec_v31)
-
-    def test_response_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.sentinel.response
-
-        with pytest.raises(TypeError):
-            validate_webhook_response(request, response, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            validate_webhook_response(request, response, spec=spec)
-
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_webhook_response(
-                request, response, spec=spec_v31, cls=Exception
-            )
-
-    def test_spec_oas30_validator_not_found(self, spec_v30):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_webhook_response(request, response, spec=spec_v30)
-
-    @mock.patch(
-        "openapi_core.validation.response.validators.WebhookResponseValidator."
-        "validate",
-    )
+    @mock.patch.object(WebhookResponseValidator, "validate")
     def test_request_response(self, mock_validate, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
         response = mock.Mock(spec=Response)
@@ -880,46 +664,7 @@ class TestValidateWebhookResponse:
 
 
 class TestValidateResponse:
-    def test_spec_not_detected(self, spec_invalid):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_response(request, response, spec=spec_invalid)
-
-    def test_spec_not_supported(self, spec_v20):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_response(request, response, spec=spec_v20)
-
-    def test_request_type_invalid(self, spec_v31):
-        request = mock.sentinel.request
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_response(request, response, spec=spec_v31)
-
-    def test_response_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.sentinel.response
-
-        with pytest.raises(TypeError):
-            validate_response(request, response, spec=spec_v31)
-
-    def test_spec_type_invalid(self):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-        spec = mock.sentinel.spec
-
-        with pytest.raises(TypeError):
-            validate_response(request, response, spec=spec)
-
-    @mock.patch(
-        "openapi_core.validation.response.validators.APICallResponseValidator."
-        "validate",
-    )
+    @mock.patch.object(APICallResponseValidator, "validate")
     def test_request_response(self, mock_validate, spec_v31):
         request = mock.Mock(spec=Request)
         response = mock.Mock(spec=Response)
@@ -947,24 +692,7 @@ class TestValidateResponse:
             (request, response),
         ]
 
-    def test_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=Request)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_response(request, response, spec=spec_v31, cls=Exception)
-
-    def test_webhook_response_validator_not_found(self, spec_v30):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(SpecError):
-            validate_response(request, response, spec=spec_v30)
-
-    @mock.patch(
-        "openapi_core.validation.response.validators.V31WebhookResponseValidator."
-        "validate",
-    )
+    @mock.patch.object(V31WebhookResponseValidator, "validate")
     def test_webhook_request(self, mock_validate, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
         response = mock.Mock(spec=Response)
@@ -974,10 +702,7 @@ class TestValidateResponse:
 
         mock_validate.assert_called_once_with(request, response)
 
-    @mock.patch(
-        "openapi_core.validation.response.validators.V31WebhookResponseValidator."
-        "validate",
-    )
+    @mock.patch.object(V31WebhookResponseValidator, "validate")
     def test_webhook_request_error(self, mock_validate, spec_v31):
         request = mock.Mock(spec=WebhookRequest)
         response = mock.Mock(spec=Response)
@@ -1005,10 +730,3 @@ class TestValidateResponse:
         assert TestWebhookResp.validate_calls == [
             (request, response),
         ]
-
-    def test_webhook_cls_type_invalid(self, spec_v31):
-        request = mock.Mock(spec=WebhookRequest)
-        response = mock.Mock(spec=Response)
-
-        with pytest.raises(TypeError):
-            validate_response(request, response, spec=spec_v31, cls=Exception)
@@ -1,4 +1,5 @@
 import enum
+from unittest import mock
 
 import pytest
 from jsonschema_path import SchemaPath
@@ -6,7 +7,12 @@ from jsonschema_path import SchemaPath
 from openapi_core import V30RequestUnmarshaller
 from openapi_core import V31RequestUnmarshaller
 from openapi_core.datatypes import Parameters
+from openapi_core.security.exceptions import SecurityProviderError
+from openapi_core.security.factories import SecurityProviderFactory
 from openapi_core.testing import MockRequest
+from openapi_core.unmarshalling.request.unmarshallers import (
+    V30RequestSecurityUnmarshaller,
+)
 
 
 class Colors(enum.Enum):
@@ -134,3 +140,111 @@ class TestRequestUnmarshaller:
 
         assert not result.errors
         assert result.parameters == Parameters(query=dict(color=Colors.BLUE))
+
+
+class TestRequestSecurityUnmarshaller:
+    @pytest.fixture(scope="session")
+    def spec(self):
+        return SchemaPath.from_dict(
+            {
+                "openapi": "3.0.3",
+                "info": {
+                    "title": "Test request security unmarshaller",
+                    "version": "0.1",
+                },
+                "paths": {
+                    "/resources": {
+                        "get": {
+                            "security": [
+                                {"api_key": []},
+                                {"api_key": [], "unknown": []},
+                            ],
+                            "responses": {
+                                "default": {"description": "Resources."}
+                            },
+                        },
+                    },
+                },
+                "components": {
+                    "securitySchemes": {
+                        "api_key": {
+                            "type": "apiKey",
+                            "name": "X-API-Key",
+                            "in": "header",
+                        },
+                    },
+                },
+            }
+        )
+
+    def test_providers_reused(self, spec):
+        missing_provider = mock.Mock(side_effect=SecurityProviderError)
+        provider = mock.Mock(return_value="MQ")
+        security_provider_factory = mock.Mock(spec=SecurityProviderFactory)
+        security_provider_factory.create.side_effect = [
+            missing_provider,
+            provider,
+        ]
+        unmarshaller = V30RequestSecurityUnmarshaller(
+            spec=spec,
+            security_provider_factory=security_provider_factory,
+        )
+        request = MockRequest(
+            host_url="http://example.com",
+            method="get",
+            path="/resources",
+        )
+
+        result = unmarshaller.unmarshal(request)
+        result_reused = unmarshaller.unmarshal(request)
+
+        api_key = {"type": "apiKey", "name": "X-API-Key", "in": "header"}
+        assert security_provider_factory.create.call_args_list == [
+            mock.call(api_key),
+            mock.call(api_key),
+        ]
+        assert missing_provider.call_count == 2
+        assert provider.call_count == 2
+        assert not result.errors
+        assert result.security == {"api_key": "MQ", "unknown": None}
+        assert result_reused.security == result.security
+
+    def test_factory_create_only(self, spec):
+        class CreateOnlySecurityProviderFactory:
+            def create(self, scheme):
+                return mock.Mock(return_value="custom")
+
+        unmarshaller = V30RequestSecurityUnmarshaller(
+            spec=spec,
+            security_provider_factory=CreateOnlySecurityProviderFactory(),
+        )
+        request = MockRequest(
+            host_url="http://example.com",
+            method="get",
+            path="/resources",
+        )
+
+        result = unmarshaller.unmarshal(request)
+
+        assert not result.errors
+        assert result.security == {"api_key": "custom"}
+
+    def test_factory_create_overridden(self, spec):
+        class CustomSecurityProviderFactory(SecurityProviderFactory):
+            def create(self, scheme):
+                return mock.Mock(return_value="custom")
+
+        unmarshaller = V30RequestSecurityUnmarshaller(
+            spec=spec,
+            security_provider_factory=CustomSecurityProviderFactory(),
+        )
+        request = MockRequest(
+            host_url="http://example.com",
+            method="get",
+            path="/resources",
+        )
+
+        result = unmarshaller.unmarshal(request)
+
+        assert not result.errors
+        assert result.security == {"api_key": "custom"}